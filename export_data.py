@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Exports the Google Sheet data as JSON files for the PHP interface.
+
+Reads the roster worksheet and the AggregatedSummary worksheet, then writes
+teams.json, players.json and stats.json (plus the champion icon assets and
+lookup maps from Data Dragon) into interface/data/.
+
+Usage:
+    python export_data.py
+"""
+import asyncio
+import functools
+import os
+import re
+import string
+import time
+import httpx
+import orjson
+import requests
+import pandas as pd
+import gspread
+from dotenv import load_dotenv
+
+# Load environment variables from .env
+load_dotenv()
+
+GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
+WORKSHEET_NAME = os.getenv("WORKSHEET_NAME")
+OUTPUT_SHEET_NAME = "AggregatedSummary"
+JSON_CREDENTIALS_FILE = os.getenv("JSON_CREDENTIALS_FILE")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "interface", "data")
+ICON_DIR = os.path.join(DATA_DIR, "champion_icons")
+
+# Data Dragon version metadata barely changes; keep it for a day on disk so
+# warm runs skip the network entirely (the icon dir already persists).
+VERSION_CACHE_FILE = os.path.join(DATA_DIR, "ddragon_version.json")
+VERSION_CACHE_TTL = 24 * 60 * 60
+
+# Compiled once; normalize_champion_name runs per row during the stats export.
+# ASCII names take the str.translate fast path (a single C loop); the regex
+# only handles names with non-ASCII characters.
+_NORM_RE = re.compile(r'[^a-zA-Z0-9]')
+_KEEP_CHARS = set(string.ascii_letters + string.digits)
+_DELETE_TABLE = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _KEEP_CHARS))
+
+# Shared session so the Data Dragon calls reuse one pooled TLS connection
+# instead of a fresh handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# -----------------------------
+# Google Sheets I/O Functions
+# -----------------------------
+def get_sheet_data(worksheet_name):
+    """
+    Retrieves the data from the specified worksheet as a DataFrame.
+
+    Args:
+        worksheet_name (str): Title of the worksheet to read.
+
+    Returns:
+        DataFrame of records (empty on failure).
+    """
+    try:
+        gc = gspread.service_account(filename=JSON_CREDENTIALS_FILE)
+        sheet = gc.open_by_key(GOOGLE_SHEET_ID)
+        worksheet = sheet.worksheet(worksheet_name)
+        # Build the frame straight from the value rows; get_all_records would
+        # allocate a dict per row that pandas immediately re-hashes.
+        values = worksheet.get_all_values()
+        if not values:
+            return pd.DataFrame()
+        df = pd.DataFrame(values[1:], columns=values[0])
+        return df
+    except Exception as e:
+        print(f"Error accessing Google Sheet: {e}")
+        return pd.DataFrame()
+
+# -----------------------------
+# Data Dragon Helpers
+# -----------------------------
+@functools.lru_cache(maxsize=1)
+def get_latest_version():
+    """
+    Returns the latest Data Dragon version string, or None on failure.
+    Memoized in-process and cached on disk for VERSION_CACHE_TTL seconds.
+    """
+    try:
+        if os.path.exists(VERSION_CACHE_FILE) and time.time() - os.path.getmtime(VERSION_CACHE_FILE) < VERSION_CACHE_TTL:
+            with open(VERSION_CACHE_FILE, 'rb') as f:
+                return orjson.loads(f.read())['version']
+    except Exception as e:
+        print(f"Ignoring unreadable version cache: {e}")
+    try:
+        response = _SESSION.get("https://ddragon.leagueoflegends.com/api/versions.json")
+        response.raise_for_status()
+        version = response.json()[0]
+    except Exception as e:
+        print(f"Error fetching Data Dragon versions: {e}")
+        return None
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(VERSION_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps({'version': version}))
+    except Exception as e:
+        print(f"Could not write version cache: {e}")
+    return version
+
+@functools.lru_cache(maxsize=1)
+def get_champion_data(version):
+    """
+    Returns the champion data dict from Data Dragon for the given version.
+    Memoized so repeated exports in one process fetch it once.
+    """
+    try:
+        url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
+        response = _SESSION.get(url)
+        response.raise_for_status()
+        return response.json()['data']
+    except Exception as e:
+        print(f"Error fetching champion data: {e}")
+        return {}
+
+def normalize_champion_name(name):
+    """
+    Normalizes a champion name for matching (strip non-alphanumerics, lowercase).
+    """
+    if name.isascii():
+        return name.translate(_DELETE_TABLE).lower()
+    return _NORM_RE.sub('', name).lower()
+
+def create_champion_mapping(champion_data):
+    """
+    Builds a mapping of normalized champion display name -> champion id.
+    """
+    mapping = {}
+    for champ_id, champ in champion_data.items():
+        mapping[normalize_champion_name(champ['name'])] = champ_id
+    return mapping
+
+async def _fetch_icon(client, sem, icon_url, icon_path):
+    """
+    Downloads a single icon under the concurrency semaphore, streaming the
+    body to disk in chunks rather than buffering the whole PNG in memory.
+
+    Streams into a temp file and renames it into place on success, so an
+    interrupted download never leaves a truncated icon at icon_path (which
+    the exists() check in download_champion_icons would then skip forever).
+    """
+    tmp_path = icon_path + '.part'
+    async with sem:
+        try:
+            async with client.stream("GET", icon_url) as response:
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+                        f.write(chunk)
+            os.replace(tmp_path, icon_path)
+        except Exception as e:
+            print(f"Error downloading icon from {icon_url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+async def _download_all(pairs):
+    """
+    Downloads all (url, path) pairs concurrently over one shared client.
+    """
+    sem = asyncio.Semaphore(16)
+    limits = httpx.Limits(max_connections=32)
+    async with httpx.AsyncClient(limits=limits) as client:
+        await asyncio.gather(*[_fetch_icon(client, sem, url, path) for url, path in pairs])
+
+def download_champion_icons(version, champion_data):
+    """
+    Downloads any missing champion icons into ICON_DIR, fetching them
+    concurrently so the first run isn't bound by ~160 serial round-trips.
+
+    Returns:
+        dict: champion display name -> icon filename.
+    """
+    os.makedirs(ICON_DIR, exist_ok=True)
+    champion_icons = {}
+    pairs = []
+    for champ_id, champ in champion_data.items():
+        icon_file = f"{champ_id}.png"
+        icon_path = os.path.join(ICON_DIR, icon_file)
+        champion_icons[champ['name']] = icon_file
+        if os.path.exists(icon_path):
+            continue
+        icon_url = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{champ_id}.png"
+        pairs.append((icon_url, icon_path))
+    if pairs:
+        asyncio.run(_download_all(pairs))
+    return champion_icons
+
+# -----------------------------
+# Export Functions
+# -----------------------------
+def export_teams(df):
+    """
+    Exports the list of team names to teams.json.
+    """
+    teams = []
+    for team_name in df['TeamName'].unique():
+        team_name = str(team_name).strip()
+        if team_name and team_name not in teams:
+            teams.append(team_name)
+    teams_path = os.path.join(DATA_DIR, 'teams.json')
+    with open(teams_path, 'wb') as f:
+        f.write(orjson.dumps(teams))
+    print(f"Exported {len(teams)} teams to {teams_path}")
+
+def export_players(df):
+    """
+    Exports the players and their accounts per team to players.json.
+    """
+    df = df.copy()
+    df['TeamName'] = df['TeamName'].astype(str).str.strip()
+    df['Name'] = df['Name'].astype(str).str.strip()
+    df['AccountName'] = df['AccountName'].astype(str).str.strip()
+    df = df[df['TeamName'].astype(bool) & df['Name'].astype(bool)]
+
+    grouped = df.groupby(['TeamName', 'Name'], sort=False)['AccountName'].apply(
+        lambda accounts: [acc for acc in accounts if acc]
+    ).reset_index()
+    team_players = {
+        team: [{'name': name, 'accounts': accounts}
+               for name, accounts in zip(team_df['Name'], team_df['AccountName'])]
+        for team, team_df in grouped.groupby('TeamName', sort=False)
+    }
+    players_path = os.path.join(DATA_DIR, 'players.json')
+    with open(players_path, 'wb') as f:
+        f.write(orjson.dumps(team_players))
+    print(f"Exported players for {len(team_players)} teams to {players_path}")
+
+def export_stats(df, champion_icons, champion_mapping):
+    """
+    Exports the aggregated champion stats, nested by team and player, to stats.json.
+    """
+    df = df.copy()
+    df['TeamName'] = df['TeamName'].astype(str).str.strip()
+    df['Name'] = df['Name'].astype(str).str.strip()
+    df = df[df['TeamName'].str.len().gt(0) & df['Name'].str.len().gt(0)]
+
+    stats_path = os.path.join(DATA_DIR, 'stats.json')
+    if df.empty:
+        with open(stats_path, 'wb') as f:
+            f.write(orjson.dumps({}))
+        print(f"No assigned stats rows; wrote empty {stats_path}")
+        return
+
+    # Blank out missing cells and convert to string once, columnar, instead
+    # of re-converting inside every (team, player) group below.
+    stat_cols = ['Total Games', 'Win Rate', 'KDA', 'CS', 'Damage', 'Gold', 'Wins', 'Losses']
+    df[stat_cols] = df[stat_cols].fillna('').astype(str)
+
+    # One flat lookup that pre-resolves both display and normalized names to
+    # icon filenames, so resolution is a dict.get with no branching per name.
+    name_to_icon = dict(champion_icons)
+    for normalized, champ_id in champion_mapping.items():
+        name_to_icon.setdefault(normalized, f"{champ_id}.png")
+
+    df['Champion'] = df['Champion'].astype(str).str.strip()
+    df['ChampionIcon'] = df['Champion'].map(name_to_icon).fillna(
+        df['Champion'].map(normalize_champion_name).map(name_to_icon)
+    ).fillna('')
+
+    column_map = {
+        'Champion': 'champion',
+        'ChampionIcon': 'champion_icon',
+        'Total Games': 'total_games',
+        'Win Rate': 'win_rate',
+        'KDA': 'kda',
+        'CS': 'cs',
+        'Damage': 'damage',
+        'Gold': 'gold',
+        'Wins': 'wins',
+        'Losses': 'losses',
+    }
+    out = df[list(column_map)].rename(columns=column_map)
+    out[['TeamName', 'Name']] = df[['TeamName', 'Name']]
+
+    champion_stats = {
+        team: {
+            player: player_df[list(column_map.values())].to_dict('records')
+            for player, player_df in team_df.groupby('Name', sort=False)
+        }
+        for team, team_df in out.groupby('TeamName', sort=False)
+    }
+    with open(stats_path, 'wb') as f:
+        f.write(orjson.dumps(champion_stats, option=orjson.OPT_INDENT_2))
+    print(f"Exported stats for {len(champion_stats)} teams to {stats_path}")
+
+def export_all_data():
+    """
+    Runs the full export: reads each worksheet once and shares the DataFrames
+    across the individual exports, then refreshes the champion assets.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    # Fetch each worksheet exactly once; the exports reuse the same DataFrames.
+    roster_df = get_sheet_data(WORKSHEET_NAME)
+    stats_df = get_sheet_data(OUTPUT_SHEET_NAME)
+
+    if roster_df.empty:
+        print("No roster data found; nothing to export.")
+        return
+
+    export_teams(roster_df)
+    export_players(roster_df)
+
+    version = get_latest_version()
+    champion_icons = {}
+    champion_mapping = {}
+    if version:
+        champion_data = get_champion_data(version)
+        champion_mapping = create_champion_mapping(champion_data)
+        champion_icons = download_champion_icons(version, champion_data)
+        with open(os.path.join(DATA_DIR, 'champion_icons.json'), 'wb') as f:
+            f.write(orjson.dumps(champion_icons))
+        with open(os.path.join(DATA_DIR, 'champion_mapping.json'), 'wb') as f:
+            f.write(orjson.dumps(champion_mapping))
+    else:
+        print("Skipping champion icon refresh (no Data Dragon version).")
+
+    if stats_df.empty:
+        print("No aggregated stats found; skipping stats export.")
+    else:
+        export_stats(stats_df, champion_icons, champion_mapping)
+
+    print("Export complete.")
+
+if __name__ == "__main__":
+    export_all_data()
@@ -3,7 +3,7 @@ Webscraper to fetch champions played for given accounts.
 This script scrapes the champions played (current season) from the player's OP.GG champions page.
 
 Usage:
-    pip install requests bs4
+    pip install requests lxml
     python webscraper.py
 
 References:
@@ -11,7 +11,7 @@ References:
 """
 
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 
 # List of account identifiers in OP.GG URL format (e.g. "Oriented-EUW")
 accounts = [
@@ -35,41 +35,45 @@ def scrape_account(account):
         print(f"Error fetching data for {account}: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
+    # Parse once with lxml (C extension); xpath replaces the nested
+    # find/find_all walking that BeautifulSoup did in pure Python.
+    doc = lxml.html.fromstring(response.text)
+
     # Locate the champion table - adjust the selector if necessary.
-    table = soup.find('table')
-    if not table:
+    # (//table)[1] is the first table in document order; //table[1] would
+    # match every table that is the first within its own parent.
+    tables = doc.xpath('(//table)[1]')
+    if not tables:
         print(f"No champion table found for account {account}")
         return []
 
-    rows = table.find_all('tr')
-    if not rows or len(rows) < 2:
+    rows = tables[0].xpath('.//tr')
+    if len(rows) < 2:
         print(f"No data rows found in the champion table for account {account}")
         return []
 
     champions = []
     # Skip the header row (assumed as the first row)
     for row in rows[1:]:
-        cols = row.find_all('td')
+        cols = [col.text_content().strip() for col in row.xpath('./td')]
         # Ensure that there are at least five columns:
         if len(cols) < 5:
             continue
 
         try:
-            rank = cols[0].get_text(strip=True)
+            rank = cols[0]
             # Skip this row if rank isn't an integer
             if not rank.isdigit():
                 continue
-            champion_name = cols[1].get_text(strip=True)
-            played = cols[2].get_text(strip=True)
-            kda = cols[3].get_text(strip=True)
-            op_score = cols[4].get_text(strip=True)
-            laning = cols[5].get_text(strip=True)
-            DMG = cols[6].get_text(strip=True)
-            wards = cols[7].get_text(strip=True)
-            CS = cols[8].get_text(strip=True)
-            Gold = cols[9].get_text(strip=True)
+            champion_name = cols[1]
+            played = cols[2]
+            kda = cols[3]
+            op_score = cols[4]
+            laning = cols[5]
+            DMG = cols[6]
+            wards = cols[7]
+            CS = cols[8]
+            Gold = cols[9]
         except Exception as e:
             print(f"Error parsing a row: {e}")
             continue
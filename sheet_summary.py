@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from tenacity import retry, retry_if_exception_type, wait_exponential, stop_after_attempt
 
 # Load environment variables from .env
 load_dotenv()
@@ -32,23 +33,50 @@ class RateLimiter:
         self.lock = threading.Lock()
         
     def acquire(self):
-        with self.lock:
-            current = time.time()
-            time_passed = current - self.last_check
-            self.last_check = current
-            self.allowance += time_passed * (self.rate / self.per)
-            if self.allowance > self.rate:
-                self.allowance = self.rate
-            if self.allowance < 1.0:
+        while True:
+            with self.lock:
+                current = time.time()
+                time_passed = current - self.last_check
+                self.last_check = current
+                self.allowance += time_passed * (self.rate / self.per)
+                if self.allowance > self.rate:
+                    self.allowance = self.rate
+                if self.allowance >= 1.0:
+                    self.allowance -= 1.0
+                    return
                 wait_time = (1.0 - self.allowance) * (self.per / self.rate)
-                time.sleep(wait_time)
-                self.allowance = 0.0
-            else:
-                self.allowance -= 1.0
+            # Sleep with the lock released so other workers can replenish and
+            # acquire concurrently instead of queueing behind this sleep.
+            time.sleep(wait_time)
 
 # Global rate limiter instance: maximum 3 actions per 1 second.
 rate_limiter = RateLimiter(rate=3, per=1)
 
+# Shared scraping pool; the rate limiter caps throughput while the workers
+# overlap per-request latency.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Back off only when the Sheets API actually pushes back (429/5xx) instead of
+# sleeping unconditionally between players.
+_sheets_retry = retry(
+    retry=retry_if_exception_type(gspread.exceptions.APIError),
+    wait=wait_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(6),
+)
+
+@_sheets_retry
+def _ws_col_values(ws, col):
+    return ws.col_values(col)
+
+@_sheets_retry
+def _sheet_batch_update(sheet, body):
+    return sheet.batch_update(body)
+
+@_sheets_retry
+def _ws_append_rows(ws, rows):
+    # Use value_input_option="RAW" to ensure numbers are stored as numbers
+    return ws.append_rows(rows, value_input_option="RAW")
+
 def fetch_stats(region, account, season):
     """
     A helper function to rate-limit and fetch champion stats.
@@ -70,8 +98,12 @@ def get_sheet_data():
         gc = gspread.service_account(filename=JSON_CREDENTIALS_FILE)
         sheet = gc.open_by_key(GOOGLE_SHEET_ID)
         worksheet = sheet.worksheet(WORKSHEET_NAME)
-        records = worksheet.get_all_records()
-        df = pd.DataFrame(records)
+        # Build the frame straight from the value rows; get_all_records would
+        # allocate a dict per row that pandas immediately re-hashes.
+        values = worksheet.get_all_values()
+        if not values:
+            return pd.DataFrame(), gc, sheet
+        df = pd.DataFrame(values[1:], columns=values[0])
         return df, gc, sheet
     except Exception as e:
         print(f"Error accessing Google Sheet: {e}")
@@ -164,69 +196,79 @@ def build_player_summaries(team_filter, region='euw1', seasons=['current', '24',
         print("Failed to access or create the output worksheet.")
         return
 
-    # Remove existing rows for players of the specified team from the output sheet.
-    all_values = out_ws.get_all_values()
-    if all_values:
-        # Keep the header and only those rows whose team is NOT the one we are updating.
-        new_values = [all_values[0]] + [row for row in all_values[1:] if row[0].strip() != team_filter]
-        out_ws.clear()
-        out_ws.update("A1", new_values)
-    
+    # Drop this team's old rows with one batchUpdate instead of reading and
+    # rewriting the whole table: fetch only column A (teams) to locate the
+    # rows, collapse consecutive indices into ranges, and delete the ranges
+    # in a single request.
+    col_a = _ws_col_values(out_ws, 1)
+    delete_ranges = []
+    for i, value in enumerate(col_a[1:], start=1):  # skip the header row
+        if value.strip() == team_filter:
+            if delete_ranges and delete_ranges[-1][1] == i:
+                delete_ranges[-1][1] = i + 1
+            else:
+                delete_ranges.append([i, i + 1])
+    if delete_ranges:
+        # Delete bottom-up so earlier ranges keep their indices.
+        delete_requests = [
+            {'deleteDimension': {'range': {
+                'sheetId': out_ws.id,
+                'dimension': 'ROWS',
+                'startIndex': start,
+                'endIndex': end,
+            }}}
+            for start, end in reversed(delete_ranges)
+        ]
+        _sheet_batch_update(sheet, {'requests': delete_requests})
+
+    all_new_rows = []
+
     # Process each player individually.
-    for idx, row in players.iterrows():
-        player_name = row['Name']
-        team_name = row['TeamName']
-        accounts_str = row['AccountName']
+    for player in players.itertuples(index=False):
+        player_name = player.Name
+        team_name = player.TeamName
+        accounts_str = player.AccountName
         account_names = [acc.strip() for acc in accounts_str.split(',')]
         all_account_data = []
         
-        for account in account_names:
-            print(f"Processing account '{account}' for player '{player_name}'...")
-            # Process each account sequentially (only one at a time).
-            with ThreadPoolExecutor(max_workers=1) as account_executor:
-                futures = []
-                for season in seasons:
-                    future = account_executor.submit(fetch_stats, region, account, season)
-                    futures.append(future)
-                for future in as_completed(futures):
-                    try:
-                        df_stats = future.result()
-                        if df_stats is not None and not df_stats.empty:
-                            all_account_data.append(df_stats)
-                    except Exception as e:
-                        print(f"Error fetching data for player '{player_name}', account '{account}': {e}")
+        # Submit every (account, season) pair for this player to the shared
+        # pool at once instead of draining a single-worker executor per account.
+        print(f"Processing accounts {account_names} for player '{player_name}'...")
+        futures = {
+            _EXECUTOR.submit(fetch_stats, region, account, season): account
+            for account in account_names
+            for season in seasons
+        }
+        for future in as_completed(futures):
+            account = futures[future]
+            try:
+                df_stats = future.result()
+                if df_stats is not None and not df_stats.empty:
+                    all_account_data.append(df_stats)
+            except Exception as e:
+                print(f"Error fetching data for player '{player_name}', account '{account}': {e}")
         
         if all_account_data:
             try:
                 aggregated_summary = aggregate_champion_stats(all_account_data)
                 if aggregated_summary is not None and not aggregated_summary.empty:
-                    player_rows = []
-                    for _, champ_row in aggregated_summary.iterrows():
-                        player_rows.append([
-                            team_name,
-                            player_name,
-                            accounts_str,
-                            champ_row.get('Champion', ''),
-                            champ_row.get('Total Games', ''),
-                            champ_row.get('Win Rate', ''),
-                            champ_row.get('KDA', ''),
-                            champ_row.get('CS', ''),
-                            champ_row.get('Damage', ''),
-                            champ_row.get('Gold', ''),
-                            champ_row.get('Wins', ''),
-                            champ_row.get('Losses', '')
-                        ])
-                    # Use value_input_option="RAW" to ensure numbers are stored as numbers
-                    out_ws.append_rows(player_rows, value_input_option="RAW")
+                    # Extract all rows in one pass instead of iterating Series.
+                    player_rows = aggregated_summary.assign(
+                        TeamName=team_name,
+                        Name=player_name,
+                        AccountName=accounts_str
+                    )[header].values.tolist()
+                    all_new_rows.extend(player_rows)
                 else:
                     print(f"Aggregation for player '{player_name}' returned no data.")
             except Exception as e:
                 print(f"Error aggregating data for player '{player_name}': {e}")
         else:
             print(f"No data collected for player '{player_name}'.")
-        
-        time.sleep(3)
-    
+
+    if all_new_rows:
+        _ws_append_rows(out_ws, all_new_rows)
+
     print("All specified team player data processed and written to the output sheet.")
 
 if __name__ == "__main__":
@@ -1,167 +1,570 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+import atexit
+import logging
+import os
 import pandas as pd
+import queue
+import re
+import lxml.html
+from lxml.cssselect import CSSSelector
+import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-def get_champion_stats(region, summoner_name, season='current'):
+log = logging.getLogger(__name__)
+
+# u.gg is a React app backed by a GraphQL API; hitting it directly skips the
+# Chrome start-up, JS execution and WebDriver roundtrips entirely. The page
+# schema is reverse-engineered, so the Selenium path stays as a fallback.
+_API_URL = "https://u.gg/api"
+_API_SESSION = requests.Session()
+_API_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Origin": "https://u.gg",
+    "User-Agent": "Mozilla/5.0",
+})
+
+_CHAMPION_STATS_QUERY = """
+query getPlayerChampionStats($regionId: String!, $riotUserName: String!, $riotTagLine: String!, $seasonId: Int!, $queueType: [Int!], $role: [Int!]) {
+  fetchPlayerStatistics(regionId: $regionId, riotUserName: $riotUserName, riotTagLine: $riotTagLine, seasonId: $seasonId, queueType: $queueType, role: $role) {
+    basicChampionPerformances {
+      championId
+      totalMatches
+      wins
+      kills
+      deaths
+      assists
+      cs
+      damage
+      gold
+    }
+  }
+}
+"""
+
+# u.gg's internal id for the newest season; bumped when a season rolls over.
+_CURRENT_SEASON_ID = 24
+
+# Strips everything but digits and decimal points from scraped cell text.
+_NON_NUMERIC = re.compile(r'[^0-9.]')
+
+# Columns every stats source hands over as numbers, not strings.
+_METRIC_COLS = ['KDA', 'CS', 'Damage', 'Gold']
+
+# Walks the rendered table in-browser and returns plain records: one
+# WebDriver roundtrip for the whole table instead of shipping the page over.
+_EXTRACT_ROWS_JS = """
+const firstLine = (el) => el ? el.innerText.trim().split('\\n')[0] : null;
+const cellText = (row, sel) => {
+    const strong = row.querySelector(sel + ' strong');
+    return strong ? strong.innerText.trim() : firstLine(row.querySelector(sel));
+};
+return Array.from(document.querySelectorAll('div.rt-tr-group')).map(row => ({
+    'Champion': firstLine(row.querySelector('.champion-cell')),
+    'Win Rate': cellText(row, '.win-rate-cell'),
+    'Games': firstLine(row.querySelector('.win-rate-cell .text-lavender-50')),
+    'KDA': cellText(row, '.kda-cell'),
+    'CS': cellText(row, '.cs-cell'),
+    'Damage': cellText(row, '.damage-cell'),
+    'Gold': cellText(row, '.gold-cell'),
+})).filter(row => row['Champion']);
+"""
+
+# Persistent Chrome profiles live here so later scrapes hit a warm HTTP
+# cache; concurrent drivers each need their own profile directory.
+_PROFILE_ROOT = os.path.join(os.path.expanduser('~'), '.ugg_chrome_profile')
+
+# Past-season stats never change and current-season stats change slowly, so
+# results are cached on disk: forever for past seasons, 6h for 'current'.
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.ugg_cache')
+_CURRENT_SEASON_TTL = 6 * 60 * 60
+
+def _cache_path(region, summoner_name, season):
+    key = f"{region}_{summoner_name.lower()}_{season}"
+    safe = ''.join(c if c.isalnum() else '_' for c in key)
+    return os.path.join(_CACHE_DIR, f"{safe}.csv")
+
+def _cache_load(region, summoner_name, season):
+    path = _cache_path(region, summoner_name, season)
+    if not os.path.exists(path):
+        return None
+    if season == 'current' and time.time() - os.path.getmtime(path) > _CURRENT_SEASON_TTL:
+        return None
+    try:
+        return pd.read_csv(path)
+    except Exception as e:
+        log.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+
+def _cache_store(df, region, summoner_name, season):
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        df.to_csv(_cache_path(region, summoner_name, season), index=False)
+    except Exception as e:
+        log.warning("Could not write cache for %r season %r: %s", summoner_name, season, e)
+
+@lru_cache(maxsize=1)
+def _champion_id_to_name():
+    """
+    Returns a Data Dragon mapping of numeric champion id -> display name.
     """
-    Scrape champion statistics for a given summoner from u.gg using Selenium
-    
+    versions = _API_SESSION.get("https://ddragon.leagueoflegends.com/api/versions.json")
+    versions.raise_for_status()
+    data = _API_SESSION.get(
+        f"https://ddragon.leagueoflegends.com/cdn/{versions.json()[0]}/data/en_US/champion.json"
+    )
+    data.raise_for_status()
+    return {int(champ['key']): champ['name'] for champ in data.json()['data'].values()}
+
+def get_champion_stats_api(region, summoner_name, season='current'):
+    """
+    Fetches champion statistics straight from u.gg's GraphQL API.
+
+    Returns a DataFrame shaped like the Selenium scraper's output, or None if
+    the request or the (reverse-engineered) schema fails.
+    """
+    try:
+        if '#' in summoner_name:
+            riot_name, riot_tag = summoner_name.split('#', 1)
+        else:
+            riot_name, riot_tag = summoner_name, region[:3].upper()
+        season_id = _CURRENT_SEASON_ID if season == 'current' else int(season)
+        response = _API_SESSION.post(_API_URL, json={
+            'operationName': 'getPlayerChampionStats',
+            'query': _CHAMPION_STATS_QUERY,
+            'variables': {
+                'regionId': region,
+                'riotUserName': riot_name.strip(),
+                'riotTagLine': riot_tag.strip(),
+                'seasonId': season_id,
+                'queueType': [420, 440],
+                'role': [],
+            },
+        })
+        response.raise_for_status()
+        payload = response.json()
+        performances = payload['data']['fetchPlayerStatistics'][0]['basicChampionPerformances']
+        id_to_name = _champion_id_to_name()
+
+        # Build the records inside the same try so any schema surprise in
+        # the per-champion fields degrades to the Selenium fallback too.
+        champions_data = []
+        for perf in performances:
+            games = perf.get('totalMatches') or 0
+            if not games:
+                continue
+            wins = perf.get('wins') or 0
+            deaths = perf.get('deaths') or 0
+            kda = ((perf.get('kills') or 0) + (perf.get('assists') or 0)) / (deaths or 1)
+            champions_data.append({
+                'Champion': id_to_name.get(perf.get('championId'), str(perf.get('championId'))),
+                'Win Rate': f"{round(wins / games * 100, 1)}%",
+                'Games': f"{wins}W {games - wins}L",
+                'KDA': round(kda, 2),
+                'CS': round((perf.get('cs') or 0) / games, 1),
+                'Damage': round((perf.get('damage') or 0) / games),
+                'Gold': round((perf.get('gold') or 0) / games),
+                'Season': season,
+            })
+        return pd.DataFrame.from_records(champions_data)
+    except Exception as e:
+        log.warning("u.gg API request failed for %r season %r: %s", summoner_name, season, e)
+        return None
+
+def _build_driver(profile_name=None):
+    """
+    Creates a headless Chrome driver configured for scraping.
+
     Args:
-        region (str): Player region (e.g., 'euw1', 'na1')
-        summoner_name (str): Summoner name
-        season (str): 'current' for current season, or season number (e.g., '24', '23')
+        profile_name (str): Profile subdirectory; concurrent drivers must
+            each use a distinct one. Defaults to a per-thread subdir, so
+            ad-hoc drivers built on concurrent threads never race on one
+            Chrome user-data-dir (which fails with SessionNotCreated).
     """
-    # Now, all summoner names are treated the same.
-    formatted_name = summoner_name.lower().replace('#', '-').replace(' ', '%20')
-    base_url = f'https://u.gg/lol/profile/{region}/{formatted_name}/champion-stats'
-    if season != 'current':
-        url = f'{base_url}?season={season}'
-    else:
-        url = base_url
-    
-    print(f"Fetching URL: {url}")
-    
-    # Setup Chrome driver with additional options for stability
+    if profile_name is None:
+        profile_name = f"thread_{threading.get_ident()}"
     options = webdriver.ChromeOptions()
     options.add_argument('--headless')  # Run in headless mode
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
-    
+    # Only the DOM text is needed, so skip images, GPU work and the other
+    # subsystems that slow page loads down.
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-software-rasterizer')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-sync')
+    options.add_argument('--disable-translate')
+    options.add_argument('--mute-audio')
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # Reuse a persistent profile so u.gg's static bundle comes from Chrome's
+    # HTTP cache on every load after the first.
+    options.add_argument(f"--user-data-dir={os.path.join(_PROFILE_ROOT, profile_name)}")
+    options.add_argument("--profile-directory=Default")
+    # Return from driver.get() at DOMContentLoaded instead of the full load
+    # event; the explicit row wait gates on the real content anyway.
+    options.page_load_strategy = "eager"
     driver = webdriver.Chrome(options=options)
-    
+    driver.set_page_load_timeout(15)
+    # Block ad/analytics/font/media requests via CDP; only the table markup
+    # matters. The HTTP cache stays enabled so repeated loads can reuse it.
     try:
-        driver.get(url)
-        
-        # Increase wait time for dynamic content to fully load
-        wait = WebDriverWait(driver, 20)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*.png", "*.jpg", "*.webp", "*.gif", "*.svg", "*.woff*", "*.mp4",
+            "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+        ]})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    except Exception as e:
+        log.warning("Could not set up CDP network blocking: %s", e)
+    return driver
+
+class DriverPool:
+    """
+    A small pool of reusable Chrome drivers, so repeated scrapes skip the
+    browser cold start. Drivers are built lazily on first checkout, checked
+    out with acquire() and handed back with release(); close_all runs at
+    interpreter exit as a safety net.
+    """
+    def __init__(self, size):
+        self.size = size
+        self._queue = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        atexit.register(self.close_all)
+
+    def acquire(self):
         try:
-            table = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "rt-tbody")))
-        except Exception as e:
-            print("Timeout or error waiting for the champion stats table to load.")
-            return pd.DataFrame()  # Return an empty DataFrame if the table isn't found
-        
-        # Find all champion rows
-        rows = table.find_elements(By.CLASS_NAME, "rt-tr-group")
-        
-        champions_data = []
-        for row in rows:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                profile = f"worker_{self._created}"
+                self._created += 1
+            else:
+                profile = None
+        if profile is not None:
+            try:
+                return _build_driver(profile_name=profile)
+            except Exception:
+                # Give the slot back, otherwise a failed build would leak it
+                # and acquire() would eventually block forever on the queue.
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._queue.get()
+
+    def release(self, driver):
+        self._queue.put(driver)
+
+    def discard(self, driver):
+        """
+        Quit a broken driver and free its slot so acquire() can rebuild it.
+        """
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def close_all(self):
+        while not self._queue.empty():
             try:
-                # Get champion name
-                champion_name = row.find_element(By.CLASS_NAME, "champion-cell").text.strip()
-                if not champion_name:  # Skip empty rows
-                    continue
-                
-                # Get win rate info - look for both possible structures
-                win_rate_cell = row.find_element(By.CLASS_NAME, "win-rate-cell")
-                try:
-                    win_rate = win_rate_cell.find_element(By.TAG_NAME, "strong").text
-                    games = win_rate_cell.find_element(By.CLASS_NAME, "text-lavender-50").text
-                except:
-                    # Backup method: get all text and split
-                    win_rate_text = win_rate_cell.text.split('\n')
-                    win_rate = win_rate_text[0] if win_rate_text else '0%'
-                    games = win_rate_text[1] if len(win_rate_text) > 1 else '0W 0L'
-                
-                # Get KDA - handle both possible formats
-                kda_cell = row.find_element(By.CLASS_NAME, "kda-cell")
-                try:
-                    kda = kda_cell.find_element(By.TAG_NAME, "strong").text
-                except:
-                    kda = kda_cell.text.split('\n')[0] if kda_cell.text else '0'
-                
-                # Get CS per minute
-                cs_cell = row.find_element(By.CLASS_NAME, "cs-cell")
-                try:
-                    cs = cs_cell.find_element(By.TAG_NAME, "strong").text
-                except:
-                    cs = cs_cell.text.split('\n')[0] if cs_cell.text else '0'
-                
-                # Get damage per minute
-                damage_cell = row.find_element(By.CLASS_NAME, "damage-cell")
-                try:
-                    damage = damage_cell.find_element(By.TAG_NAME, "strong").text
-                except:
-                    damage = damage_cell.text.split('\n')[0] if damage_cell.text else '0'
-                
-                # Get gold per minute
-                gold_cell = row.find_element(By.CLASS_NAME, "gold-cell")
-                try:
-                    gold = gold_cell.find_element(By.TAG_NAME, "strong").text
-                except:
-                    gold = gold_cell.text.split('\n')[0] if gold_cell.text else '0'
-                
-                # Clean the values (remove any non-numeric characters except decimal points)
-                cs = ''.join(c for c in cs if c.isdigit() or c == '.')
-                damage = ''.join(c for c in damage if c.isdigit() or c == '.')
-                gold = ''.join(c for c in gold if c.isdigit() or c == '.')
-                
-                print(f"Found champion: {champion_name}, WR: {win_rate}, Games: {games}, KDA: {kda}, CS: {cs}, DMG: {damage}, Gold: {gold}")
-                
-                champions_data.append({
-                    'Champion': champion_name,
-                    'Win Rate': win_rate,
-                    'Games': games,
-                    'KDA': kda,
-                    'CS': cs or '0',
-                    'Damage': damage or '0',
-                    'Gold': gold or '0',
-                    'Season': season
-                })
-                
-            except Exception as e:
-                print(f"Error parsing row: {e}")
+                self._queue.get_nowait().quit()
+            except Exception:
+                pass
+
+# One process-wide pool shared by every caller that doesn't bring its own
+# driver; created lazily so cache- and API-only runs never start Chrome.
+_SHARED_POOL_SIZE = 4
+_shared_pool_instance = None
+_shared_pool_lock = threading.Lock()
+
+def _shared_pool():
+    global _shared_pool_instance
+    with _shared_pool_lock:
+        if _shared_pool_instance is None:
+            _shared_pool_instance = DriverPool(_SHARED_POOL_SIZE)
+    return _shared_pool_instance
+
+def _build_url(region, summoner_name, season):
+    """
+    Builds the u.gg champion-stats URL for a summoner and season.
+    """
+    # Now, all summoner names are treated the same.
+    formatted_name = summoner_name.lower().replace('#', '-').replace(' ', '%20')
+    base_url = f'https://u.gg/lol/profile/{region}/{formatted_name}/champion-stats'
+    if season != 'current':
+        return f'{base_url}?season={season}'
+    return base_url
+
+def _scrape_url(driver, url, season):
+    """
+    Scrapes one champion-stats page using an already-created driver.
+    """
+    log.info("Fetching URL: %s", url)
+    try:
+        driver.get(url)
+    except TimeoutException:
+        # Slow third-party resources can outlive the page-load timeout; the
+        # table wait below decides whether the page is actually usable.
+        log.warning("Page load timed out for %s; continuing with partial load", url)
+
+    # rt-tbody shows up before React fills in the rows, so gate on at least
+    # one populated champion cell instead, polling every 100ms rather than
+    # the 500ms default. Implicit waits are zeroed so they can't compound
+    # with the explicit one.
+    driver.implicitly_wait(0)
+    wait = WebDriverWait(driver, 15, poll_frequency=0.1)
+    try:
+        wait.until(lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.rt-tr-group .champion-cell")) > 0)
+    except Exception as e:
+        log.warning("Timeout or error waiting for the champion stats table to load.")
+        return pd.DataFrame()  # Return an empty DataFrame if the table isn't found
+
+    # Extract every row with a single in-browser script; fall back to
+    # parsing the page source locally if the script fails.
+    try:
+        rows_data = driver.execute_script(_EXTRACT_ROWS_JS)
+    except Exception as e:
+        log.warning("In-browser extraction failed, parsing page source instead: %s", e)
+        rows_data = None
+    if rows_data is None:
+        return _parse_page_source(driver.page_source, season)
+
+    df = pd.DataFrame(rows_data)
+    if df.empty:
+        return df
+    df = df.fillna({'Win Rate': '0%', 'Games': '0W 0L', 'KDA': '0', 'CS': '0', 'Damage': '0', 'Gold': '0'})
+    # Clean the numeric columns vectorially (keep digits and decimal points)
+    for col in ['CS', 'Damage', 'Gold']:
+        df[col] = df[col].astype(str).str.replace(_NON_NUMERIC, '', regex=True).replace('', '0')
+    # Metric columns leave the scraper as numbers; aggregation relies on it.
+    df[_METRIC_COLS] = df[_METRIC_COLS].apply(pd.to_numeric, errors='coerce')
+    df['Season'] = season
+    return df
+
+# Compiled CSS selectors, keyed by expression; compiling once keeps the
+# per-cell lookups entirely in lxml's C selector engine.
+_CSS_SELECTORS = {}
+_ROW_SELECTOR = CSSSelector("div.rt-tr-group")
+
+def _cell(row, sel):
+    """
+    Text of the first element matching sel inside row, or '' on a miss.
+    """
+    selector = _CSS_SELECTORS.get(sel)
+    if selector is None:
+        selector = _CSS_SELECTORS[sel] = CSSSelector(sel)
+    matches = selector(row)
+    return matches[0].text_content().strip() if matches else ''
+
+def _cell_first_text(row, sel):
+    """
+    First non-empty text node under the first element matching sel, or ''.
+
+    text_content() concatenates child nodes with no separator (a win-rate
+    cell would come back as '55%21W 14L'), so the whole-cell fallbacks take
+    just the leading text node, mirroring the in-browser firstLine helper.
+    """
+    selector = _CSS_SELECTORS.get(sel)
+    if selector is None:
+        selector = _CSS_SELECTORS[sel] = CSSSelector(sel)
+    matches = selector(row)
+    if not matches:
+        return ''
+    for text in matches[0].itertext():
+        text = text.strip()
+        if text:
+            return text
+    return ''
+
+def _parse_page_source(html, season):
+    """
+    Fallback parser: walks the champion table in a page-source snapshot.
+    """
+    tree = lxml.html.fromstring(html)
+    champions_data = []
+    for row in _ROW_SELECTOR(tree):
+        try:
+            # Get champion name
+            champion_name = _cell_first_text(row, ".champion-cell")
+            if not champion_name:  # Skip empty rows
                 continue
-        
-        return pd.DataFrame(champions_data)
-        
+
+            # Prefer the <strong> value and fall back to the cell's first
+            # text node; both helpers return '' on a miss, so neither path
+            # raises.
+            win_rate = _cell(row, ".win-rate-cell strong") or _cell_first_text(row, ".win-rate-cell") or '0%'
+            games = _cell_first_text(row, ".win-rate-cell .text-lavender-50") or '0W 0L'
+            kda = _cell(row, ".kda-cell strong") or _cell_first_text(row, ".kda-cell") or '0'
+            cs = _cell(row, ".cs-cell strong") or _cell_first_text(row, ".cs-cell")
+            damage = _cell(row, ".damage-cell strong") or _cell_first_text(row, ".damage-cell")
+            gold = _cell(row, ".gold-cell strong") or _cell_first_text(row, ".gold-cell")
+
+            # Clean the values (remove any non-numeric characters except decimal points)
+            cs = _NON_NUMERIC.sub('', cs)
+            damage = _NON_NUMERIC.sub('', damage)
+            gold = _NON_NUMERIC.sub('', gold)
+
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Found champion: %s, WR: %s, Games: %s, KDA: %s, CS: %s, DMG: %s, Gold: %s",
+                          champion_name, win_rate, games, kda, cs, damage, gold)
+
+            champions_data.append({
+                'Champion': champion_name,
+                'Win Rate': win_rate,
+                'Games': games,
+                'KDA': kda,
+                'CS': cs or '0',
+                'Damage': damage or '0',
+                'Gold': gold or '0',
+                'Season': season
+            })
+
+        except Exception as e:
+            log.warning("Error parsing row: %s", e)
+            continue
+
+    df = pd.DataFrame(champions_data)
+    if not df.empty:
+        df[_METRIC_COLS] = df[_METRIC_COLS].apply(pd.to_numeric, errors='coerce')
+    return df
+
+def get_champion_stats(region, summoner_name, season='current', use_api=True, driver=None):
+    """
+    Fetch champion statistics for a given summoner from u.gg.
+
+    Args:
+        region (str): Player region (e.g., 'euw1', 'na1')
+        summoner_name (str): Summoner name
+        season (str): 'current' for current season, or season number (e.g., '24', '23')
+        use_api (bool): Try the GraphQL API first, falling back to Selenium
+        driver: Optional already-created driver; when None one is checked
+            out of the shared pool for the duration of the call
+    """
+    cached = _cache_load(region, summoner_name, season)
+    if cached is not None:
+        return cached
+    if use_api:
+        df = get_champion_stats_api(region, summoner_name, season)
+        if df is not None and not df.empty:
+            _cache_store(df, region, summoner_name, season)
+            return df
+    url = _build_url(region, summoner_name, season)
+    pool = _shared_pool() if driver is None else None
+    if pool is not None:
+        driver = pool.acquire()
+    try:
+        df = _scrape_url(driver, url, season)
+        if df is not None and not df.empty:
+            _cache_store(df, region, summoner_name, season)
+        return df
     except Exception as e:
-        print(f"Error fetching data: {e}")
+        log.exception("Error fetching data")
+        if pool is not None:
+            # Don't recycle a driver whose scrape blew up; quit it and let
+            # the pool build a fresh one for the next checkout.
+            pool.discard(driver)
+            driver = None
         return None
-        
     finally:
-        driver.quit()
+        if pool is not None and driver is not None:
+            pool.release(driver)
+
+def get_champion_stats_multi(region, summoner_name, seasons, max_concurrency=4):
+    """
+    Fetch several seasons for one summoner concurrently.
+
+    Each season goes through get_champion_stats, so cache hits return
+    without starting a browser, the API fast path is tried first, and any
+    Selenium fallbacks reuse drivers from the shared pool.
+
+    Args:
+        region (str): Player region (e.g., 'euw1', 'na1')
+        summoner_name (str): Summoner name
+        seasons (list): Season identifiers as accepted by get_champion_stats
+        max_concurrency (int): Upper bound on parallel fetches
+
+    Returns:
+        list: Non-empty DataFrames, one per season that returned data.
+    """
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(seasons)))) as executor:
+        futures = {
+            executor.submit(get_champion_stats, region, summoner_name, season): season
+            for season in seasons
+        }
+        for future in as_completed(futures):
+            try:
+                df = future.result()
+                if df is not None and not df.empty:
+                    results.append(df)
+            except Exception:
+                log.exception("Error fetching season %r", futures[future])
+    return results
 
 def aggregate_champion_stats(all_data):
     """
     Aggregate champion statistics across all seasons
-    
+
     Args:
         all_data (list): List of DataFrames containing champion stats from different seasons
     """
     if not all_data:
         return None
-        
+
     # Combine all DataFrames
     combined_df = pd.concat(all_data, ignore_index=True)
-    
-    # Process the Games column to extract W/L numbers
-    combined_df[['Wins', 'Losses']] = combined_df['Games'].str.extract(r'(\d+)W (\d+)L')
-    
-    # Fill NaN values with 0 before converting to int
-    combined_df['Wins'] = combined_df['Wins'].fillna(0).astype(int)
-    combined_df['Losses'] = combined_df['Losses'].fillna(0).astype(int)
-    
-    # Group by Champion and calculate aggregated stats
-    aggregated = combined_df.groupby('Champion').agg({
-        'Wins': 'sum',
-        'Losses': 'sum',
-        'KDA': lambda x: round(sum(float(i) for i in x if str(i).replace('.', '').isdigit()) / len(x), 2),
-        'CS': lambda x: round(sum(float(i) for i in x if str(i).replace('.', '').isdigit()) / len(x), 1),
-        'Damage': lambda x: round(sum(float(i) for i in x if str(i).replace('.', '').isdigit()) / len(x), 0),
-        'Gold': lambda x: round(sum(float(i) for i in x if str(i).replace('.', '').isdigit()) / len(x), 0),
-    }).reset_index()
-    
+
+    # Process the Games column to extract W/L numbers; going through Int64
+    # handles missing matches without a separate object-column fillna pass,
+    # and int32 halves the memory of these columns.
+    wl = combined_df['Games'].str.extract(r'(\d+)W\s+(\d+)L').astype('Int64').fillna(0)
+    combined_df['Wins'] = wl[0].astype('int32')
+    combined_df['Losses'] = wl[1].astype('int32')
+
+    # The metric columns are numeric from the moment each frame is built
+    # (scraper, API and cache paths alike), so no re-validation pass is
+    # needed here; the groupby runs native means directly.
+    # Group by Champion and calculate aggregated stats. Categorical keys hash
+    # faster, and as_index=False avoids the reset_index copy afterwards.
+    combined_df['Champion'] = combined_df['Champion'].astype('category')
+    aggregated = combined_df.groupby('Champion', as_index=False, sort=False, observed=True).agg(
+        Wins=('Wins', 'sum'),
+        Losses=('Losses', 'sum'),
+        KDA=('KDA', 'mean'),
+        CS=('CS', 'mean'),
+        Damage=('Damage', 'mean'),
+        Gold=('Gold', 'mean'),
+    ).round({'KDA': 2, 'CS': 1, 'Damage': 0, 'Gold': 0})
+
+    # A garbled scrape can coerce a metric to NaN, and NaN means would leak
+    # into the output rows (which append_rows can't serialize); zero them.
+    aggregated[_METRIC_COLS] = aggregated[_METRIC_COLS].fillna(0)
+
     # Calculate total games and win rate
     aggregated['Total Games'] = aggregated['Wins'] + aggregated['Losses']
     aggregated['Win Rate'] = round(
         aggregated['Wins'].div(aggregated['Total Games'].where(aggregated['Total Games'] != 0, 1)) * 100, 1
     )
-    
-    # Sort by total games played, then win rate
+
+    # Sort by total games played, then win rate (both still numeric here)
     aggregated = aggregated.sort_values(['Total Games', 'Win Rate'], ascending=[False, False])
-    aggregated['Win Rate'] = aggregated['Win Rate'].astype(str) + '%'
-    
-    return aggregated[['Champion', 'Total Games', 'Win Rate', 'KDA', 'CS', 'Damage', 'Gold', 'Wins', 'Losses']]
+
+    # Only format the win rate for display in the final projection, so the
+    # column stays numeric for sorting and any downstream numeric use.
+    result = aggregated[['Champion', 'Total Games', 'Win Rate', 'KDA', 'CS', 'Damage', 'Gold', 'Wins', 'Losses']].copy()
+    result['Win Rate'] = result['Win Rate'].map(lambda v: f"{v}%")
+    return result